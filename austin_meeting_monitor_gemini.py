@@ -1,12 +1,20 @@
+import io
 import os
 import re
 import json
-import time
+import threading
+import multiprocessing
 import sqlite3
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from datetime import datetime
-from bs4 import BeautifulSoup
+from types import MappingProxyType
+from selectolax.lexbor import LexborHTMLParser
 from urllib.parse import urljoin
+from html import unescape
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
 import logging
 
 # PDF text extraction
@@ -30,6 +38,96 @@ except ImportError:
     logging.warning("Gemini not available. Install: pip install google-generativeai")
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+# The format doesn't use thread or process info, so skip collecting it per record
+logging.logThreads = False
+logging.logProcesses = False
+
+# Meeting page links follow the pattern /YYYYMMDD-type.htm
+_MEETING_RE = re.compile(r'/(\d{8}-[a-z]+)\.htm')
+
+# Scan raw HTML for meeting links (href, meeting ID, link text) without building a DOM.
+# Each link is found from its own opening tag; the href may be quoted or unquoted, and
+# the text stops at the next <a or </a> so an unclosed or self-closing link can't swallow
+# the links after it. Only tag and attribute names are case-insensitive.
+_MEETING_LINK_RE = re.compile(
+    r'''(?i:<a)\s(?:[^>]*?\s)?(?i:href)\s*=\s*(["']?)'''
+    r'''([^"'\s>]*?/(\d{8}-[a-z]+)\.htm[^"'\s>]*)\1[^>]*>'''
+    r'''((?:(?!(?i:<a[\s>]|</a\s*>)).)*)''',
+    re.DOTALL
+)
+_COMMENT_RE = re.compile(r'<!--.*?-->', re.DOTALL)
+_TAG_RE = re.compile(r'<[^>]+>')
+
+# Set to False to always find meeting links by parsing the page with selectolax
+REGEX_LINK_SCAN = True
+
+# Meeting type codes and their readable names
+_TYPE_MAP = MappingProxyType({
+    'reg': 'Regular Meeting',
+    'wrk': 'Work Session',
+    'spec': 'Special Called Meeting',
+    'afc': 'Audit & Finance Committee',
+    'mobc': 'Mobility Committee',
+    'phc': 'Public Health Committee',
+    'hpc': 'Housing & Planning Committee',
+    'cwepc': 'Climate, Water, Energy & Public Enterprises Committee',
+    'psc': 'Public Safety Committee',
+    'eoc': 'Economic Opportunity Committee'
+})
+
+# Concurrent meeting processing, with new meetings started at most once per interval
+MAX_WORKERS = 4
+REQUEST_INTERVAL = 2  # seconds
+
+# PDF libraries are not thread-safe, so meeting threads extract text one at a time
+_PDF_LOCK = threading.Lock()
+
+# Gemini system instruction; each request sends only the agenda text
+SUMMARY_INSTRUCTION = """Summarize this Austin City Council agenda in 3-5 bullet points.
+Focus on the most important items, public hearings, and policy decisions.
+Keep it concise and accessible to the general public."""
+MAX_AGENDA_CHARS = 100000  # Gemini can handle large context
+
+# Agendas longer than this are split across worker processes for text extraction.
+# Each spawned worker re-imports this module once (~0.8s), so the first parallel
+# PDF of a run only pays off once the pages save more than that start-up time.
+PARALLEL_PAGE_THRESHOLD = 100
+
+# Shared by every meeting thread (one PDF at a time under _PDF_LOCK), so a check
+# cycle never runs more than os.cpu_count() extraction processes
+_pdf_pool = None
+
+
+def _get_pdf_pool():
+    """Return the PDF extraction process pool, starting it on first use (hold _PDF_LOCK)"""
+    global _pdf_pool
+    if _pdf_pool is None:
+        # Spawn rather than fork: the monitor may already be running worker threads
+        _pdf_pool = ProcessPoolExecutor(
+            max_workers=os.cpu_count(),
+            mp_context=multiprocessing.get_context('spawn')
+        )
+    return _pdf_pool
+
+
+def _reset_pdf_pool(wait=True):
+    """Stop the PDF extraction worker processes, if any were started (hold _PDF_LOCK)"""
+    global _pdf_pool
+    if _pdf_pool is not None:
+        _pdf_pool.shutdown(wait=wait)
+        _pdf_pool = None
+
+
+def _shutdown_pdf_pool():
+    """Stop the PDF extraction worker processes, if any were started"""
+    with _PDF_LOCK:
+        _reset_pdf_pool()
+
+
+def _extract_page_range(pdf_bytes, start, stop):
+    """Extract text from pages [start, stop) with PyMuPDF (runs in a worker process)"""
+    with fitz.open(stream=pdf_bytes, filetype='pdf') as doc:
+        return "".join(doc.load_page(i).get_text("text", sort=True) for i in range(start, stop))
 
 
 class AustinCouncilMonitor:
@@ -45,12 +143,30 @@ class AustinCouncilMonitor:
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Austin Council Monitor - Public Information Tool)'
         })
+        
+        # Pool connections across worker threads and retry transient failures
+        adapter = HTTPAdapter(
+            pool_connections=8,
+            pool_maxsize=16,
+            max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504])
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
         self.init_database()
         
+        # Hold one connection for the monitor's lifetime
+        self.conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        self.conn.execute('PRAGMA synchronous=NORMAL')
+        self.db_lock = threading.Lock()
+        
         # Configure Gemini if available
         if self.gemini_api_key and GEMINI_AVAILABLE:
             genai.configure(api_key=self.gemini_api_key)
-            self.gemini_model = genai.GenerativeModel('gemini-flash-latest')
+            self.gemini_model = genai.GenerativeModel(
+                'gemini-flash-latest',
+                system_instruction=SUMMARY_INSTRUCTION
+            )
             logging.info("✓ Gemini API configured successfully")
         else:
             self.gemini_model = None
@@ -86,13 +202,79 @@ class AustinCouncilMonitor:
             )
         ''')
         
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS fetch_cache (
+                url TEXT PRIMARY KEY,
+                etag TEXT,
+                last_modified TEXT
+            )
+        ''')
+        
+        # Serve ORDER BY date and meeting type lookups from indexes
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_meetings_date ON meetings(date DESC)')
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_meetings_type ON meetings(meeting_type)')
+        
+        self._init_search_index(cursor)
+        
         conn.commit()
         conn.close()
-        logging.info(f"✓ Database initialized: {self.db_path}")
+        logging.info("✓ Database initialized: %s", self.db_path)
+    
+    def _init_search_index(self, cursor):
+        """
+        Create the FTS5 index over meeting type and summary, kept in sync by triggers
+        Rows are keyed by meeting id rather than rowid, which VACUUM may renumber
+        because meetings has no INTEGER PRIMARY KEY
+        """
+        cursor.execute("SELECT sql FROM sqlite_master WHERE type = 'table' AND name = 'meetings_fts'")
+        row = cursor.fetchone()
+        
+        # Replace the earlier rowid-keyed (external content) index
+        if row and "content='meetings'" in row[0]:
+            for trigger in ('meetings_fts_insert', 'meetings_fts_delete', 'meetings_fts_update'):
+                cursor.execute(f'DROP TRIGGER IF EXISTS {trigger}')
+            cursor.execute('DROP TABLE meetings_fts')
+            row = None
+        is_new = row is None
+        
+        try:
+            cursor.execute('''
+                CREATE VIRTUAL TABLE IF NOT EXISTS meetings_fts USING fts5(
+                    id UNINDEXED, meeting_type, summary
+                )
+            ''')
+        except sqlite3.OperationalError as e:
+            logging.warning("⚠️  SQLite FTS5 not available - dashboard search will use LIKE: %s", e)
+            return
+        
+        cursor.execute('''
+            CREATE TRIGGER IF NOT EXISTS meetings_fts_insert AFTER INSERT ON meetings BEGIN
+                INSERT INTO meetings_fts (id, meeting_type, summary)
+                VALUES (new.id, new.meeting_type, new.summary);
+            END
+        ''')
+        cursor.execute('''
+            CREATE TRIGGER IF NOT EXISTS meetings_fts_delete AFTER DELETE ON meetings BEGIN
+                DELETE FROM meetings_fts WHERE id = old.id;
+            END
+        ''')
+        cursor.execute('''
+            CREATE TRIGGER IF NOT EXISTS meetings_fts_update AFTER UPDATE OF id, meeting_type, summary ON meetings BEGIN
+                UPDATE meetings_fts SET id = new.id, meeting_type = new.meeting_type, summary = new.summary
+                WHERE id = old.id;
+            END
+        ''')
+        
+        # Index meetings saved before the search index existed
+        if is_new:
+            cursor.execute('''
+                INSERT INTO meetings_fts (id, meeting_type, summary)
+                SELECT id, meeting_type, summary FROM meetings
+            ''')
     
     def extract_meeting_id(self, url):
         """Extract unique meeting ID from URL (e.g., 20260122-reg)"""
-        match = re.search(r'/(\d{8}-[a-z]+)\.htm', url)
+        match = _MEETING_RE.search(url)
         return match.group(1) if match else None
     
     def check_for_new_meetings(self, info_center_url='https://www.austintexas.gov/department/city-council/council/council_meeting_info_center.htm'):
@@ -105,77 +287,133 @@ class AustinCouncilMonitor:
         logging.info("="*60)
         
         try:
-            response = self.session.get(info_center_url, timeout=15)
+            # Ask for the page only if it changed since the last complete check
+            headers = {}
+            etag, last_modified = self.get_fetch_cache(info_center_url)
+            if etag:
+                headers['If-None-Match'] = etag
+            if last_modified:
+                headers['If-Modified-Since'] = last_modified
+            
+            response = self.session.get(info_center_url, headers=headers, timeout=15)
             response.raise_for_status()
-            soup = BeautifulSoup(response.text, 'html.parser')
             
-            new_meetings = []
+            if response.status_code == 304:
+                logging.info("  ℹ️  Meeting Info Center unchanged since last check")
+                return []
             
-            # Find all meeting links (they follow pattern: YYYYMMDD-type.htm)
-            for link in soup.find_all('a', href=True):
-                href = link['href']
+            candidates = self.find_meeting_links(response.text)
+            known = self.existing_meeting_ids(list(candidates))
+            
+            new_meetings = []
+            for meeting_id, (href, link_text) in candidates.items():
+                if meeting_id in known:
+                    continue
                 
-                # Look for meeting page links
-                if re.search(r'/\d{8}-[a-z]+\.htm', href):
-                    meeting_id = self.extract_meeting_id(href)
-                    
-                    if meeting_id and not self.meeting_exists(meeting_id):
-                        full_url = urljoin(info_center_url, href)
-                        
-                        # Extract date and type from ID
-                        date_str = meeting_id[:8]
-                        meeting_type = meeting_id[9:]
-                        
-                        try:
-                            date_obj = datetime.strptime(date_str, '%Y%m%d')
-                            formatted_date = date_obj.strftime('%Y-%m-%d')
-                        except ValueError:
-                            formatted_date = date_str
-                        
-                        meeting_data = {
-                            'id': meeting_id,
-                            'date': formatted_date,
-                            'meeting_type': self.format_meeting_type(meeting_type),
-                            'url': full_url,
-                            'link_text': link.get_text().strip()
-                        }
-                        
-                        new_meetings.append(meeting_data)
-                        logging.info(f"  🆕 New meeting found: {meeting_id} - {meeting_data['link_text']}")
+                full_url = urljoin(info_center_url, href)
+                
+                # Extract date and type from ID
+                date_str = meeting_id[:8]
+                meeting_type = meeting_id[9:]
+                
+                # YYYYMMDD -> YYYY-MM-DD by slicing; no need to round-trip through datetime
+                if len(date_str) == 8 and date_str.isdigit():
+                    formatted_date = f"{date_str[:4]}-{date_str[4:6]}-{date_str[6:8]}"
+                else:
+                    formatted_date = date_str
+                
+                meeting_data = {
+                    'id': meeting_id,
+                    'date': formatted_date,
+                    'meeting_type': self.format_meeting_type(meeting_type),
+                    'url': full_url,
+                    'link_text': link_text
+                }
+                
+                new_meetings.append(meeting_data)
+                logging.info("  🆕 New meeting found: %s - %s", meeting_id, link_text)
             
             if not new_meetings:
                 logging.info("  ℹ️  No new meetings found")
+                
+                # Only remember the page once every meeting on it is in the database,
+                # so a cycle that fails mid-processing re-fetches the page next time
+                self.save_fetch_cache(
+                    info_center_url,
+                    response.headers.get('ETag'),
+                    response.headers.get('Last-Modified')
+                )
             
             return new_meetings
             
         except Exception as e:
-            logging.error(f"✗ Error checking for new meetings: {e}")
+            logging.error("✗ Error checking for new meetings: %s", e)
             return []
     
     def meeting_exists(self, meeting_id):
         """Check if meeting ID already exists in database"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        cursor.execute('SELECT id FROM meetings WHERE id = ?', (meeting_id,))
-        exists = cursor.fetchone() is not None
-        conn.close()
-        return exists
+        return meeting_id in self.existing_meeting_ids([meeting_id])
+    
+    def find_meeting_links(self, html):
+        """
+        Find meeting links (they follow pattern: YYYYMMDD-type.htm)
+        Returns dict of meeting ID -> (href, link text), first link wins
+        """
+        candidates = {}
+        
+        if REGEX_LINK_SCAN:
+            # Commented-out links aren't on the page, so drop comments before scanning
+            for match in _MEETING_LINK_RE.finditer(_COMMENT_RE.sub('', html)):
+                _, href, meeting_id, inner_html = match.groups()
+                link_text = unescape(_TAG_RE.sub('', inner_html)).strip()
+                candidates.setdefault(meeting_id, (unescape(href), link_text))
+            
+            if candidates:
+                return candidates
+            
+            # Nothing matched - markup may have changed, so fall back to a full parse
+            logging.info("  ℹ️  Regex scan found no meeting links, parsing page")
+        
+        tree = LexborHTMLParser(html)
+        for link in tree.css('a[href]'):
+            href = link.attributes['href'] or ''
+            
+            # Look for meeting page links
+            match = _MEETING_RE.search(href)
+            if match:
+                candidates.setdefault(match.group(1), (href, link.text().strip()))
+        
+        return candidates
+    
+    def get_fetch_cache(self, url):
+        """Return the (etag, last_modified) stored for a URL"""
+        cursor = self.conn.cursor()
+        cursor.execute('SELECT etag, last_modified FROM fetch_cache WHERE url = ?', (url,))
+        row = cursor.fetchone()
+        return row if row else (None, None)
+    
+    def save_fetch_cache(self, url, etag, last_modified):
+        """Store the validators from the latest fetch of a URL"""
+        with self.db_lock:
+            self.conn.execute(
+                'INSERT OR REPLACE INTO fetch_cache (url, etag, last_modified) VALUES (?, ?, ?)',
+                (url, etag, last_modified)
+            )
+            self.conn.commit()
+    
+    def existing_meeting_ids(self, meeting_ids):
+        """Return the subset of meeting IDs already in the database"""
+        if not meeting_ids:
+            return set()
+        
+        placeholders = ','.join('?' * len(meeting_ids))
+        cursor = self.conn.cursor()
+        cursor.execute(f'SELECT id FROM meetings WHERE id IN ({placeholders})', meeting_ids)
+        return {row[0] for row in cursor.fetchall()}
     
     def format_meeting_type(self, type_code):
         """Convert meeting type code to readable name"""
-        type_map = {
-            'reg': 'Regular Meeting',
-            'wrk': 'Work Session',
-            'spec': 'Special Called Meeting',
-            'afc': 'Audit & Finance Committee',
-            'mobc': 'Mobility Committee',
-            'phc': 'Public Health Committee',
-            'hpc': 'Housing & Planning Committee',
-            'cwepc': 'Climate, Water, Energy & Public Enterprises Committee',
-            'psc': 'Public Safety Committee',
-            'eoc': 'Economic Opportunity Committee'
-        }
-        return type_map.get(type_code, type_code.upper())
+        return _TYPE_MAP.get(type_code, type_code.upper())
     
     def get_agenda_url(self, meeting_url):
         """
@@ -184,12 +422,12 @@ class AustinCouncilMonitor:
         try:
             response = self.session.get(meeting_url, timeout=15)
             response.raise_for_status()
-            soup = BeautifulSoup(response.text, 'html.parser')
+            tree = LexborHTMLParser(response.text)
             
             # Look for agenda links
-            for link in soup.find_all('a', href=True):
-                href = link['href']
-                link_text = link.get_text().lower()
+            for link in tree.css('a[href]'):
+                href = link.attributes['href'] or ''
+                link_text = link.text().lower()
                 
                 # Check if it's an agenda
                 if 'agenda' in link_text and (href.endswith('.pdf') or 'document.cfm?id=' in href):
@@ -198,61 +436,85 @@ class AustinCouncilMonitor:
             return None
             
         except Exception as e:
-            logging.error(f"✗ Error finding agenda URL: {e}")
+            logging.error("✗ Error finding agenda URL: %s", e)
             return None
     
-    def download_pdf(self, url, save_path):
-        """Download PDF from URL"""
+    def download_pdf(self, url):
+        """Download PDF from URL, returning its bytes"""
         try:
             response = self.session.get(url, timeout=30)
             response.raise_for_status()
             
-            with open(save_path, 'wb') as f:
-                f.write(response.content)
-            
-            logging.info(f"  ✓ Downloaded PDF: {os.path.basename(save_path)}")
-            return True
+            logging.info("  ✓ Downloaded PDF (%d bytes)", len(response.content))
+            return response.content
             
         except Exception as e:
-            logging.error(f"  ✗ Error downloading PDF: {e}")
-            return False
+            logging.error("  ✗ Error downloading PDF: %s", e)
+            return None
     
-    def extract_text_from_pdf(self, pdf_path):
-        """Extract text from PDF using available library"""
+    def extract_text_from_pdf(self, pdf_bytes):
+        """Extract text from in-memory PDF bytes using available library"""
         if PDF_LIBRARY == 'pymupdf':
-            return self._extract_with_pymupdf(pdf_path)
+            with _PDF_LOCK:
+                return self._extract_with_pymupdf(pdf_bytes)
         elif PDF_LIBRARY == 'pdfplumber':
-            return self._extract_with_pdfplumber(pdf_path)
+            with _PDF_LOCK:
+                return self._extract_with_pdfplumber(pdf_bytes)
         else:
             logging.error("  ✗ No PDF extraction library available")
             return None
     
-    def _extract_with_pymupdf(self, pdf_path):
+    def _extract_with_pymupdf(self, pdf_bytes):
         """Extract text using PyMuPDF"""
         try:
-            doc = fitz.open(pdf_path)
-            text = ""
-            for page in doc:
-                text += page.get_text()
-            doc.close()
-            logging.info(f"  ✓ Extracted {len(text)} characters from PDF")
+            parts = []
+            with fitz.open(stream=pdf_bytes, filetype='pdf') as doc:
+                if doc.page_count > PARALLEL_PAGE_THRESHOLD and (os.cpu_count() or 1) > 1:
+                    parts = self._extract_pages_in_parallel(pdf_bytes, doc.page_count)
+                else:
+                    for page in doc:
+                        parts.append(page.get_text("text", sort=True))
+            text = "".join(parts)
+            logging.info("  ✓ Extracted %d characters from PDF", len(text))
             return text
         except Exception as e:
-            logging.error(f"  ✗ PyMuPDF extraction error: {e}")
+            logging.error("  ✗ PyMuPDF extraction error: %s", e)
             return None
     
-    def _extract_with_pdfplumber(self, pdf_path):
+    def _extract_pages_in_parallel(self, pdf_bytes, page_count):
+        """
+        Extract text from page ranges in separate processes, returned in page order
+        PyMuPDF is not thread-safe, so each process opens its own Document
+        """
+        # One range per worker, so each worker receives one copy of the PDF bytes
+        workers = os.cpu_count()
+        chunk_size = -(-page_count // workers)  # ceiling division
+        starts = range(0, page_count, chunk_size)
+        stops = [min(start + chunk_size, page_count) for start in starts]
+        
+        pool = _get_pdf_pool()
+        try:
+            return list(pool.map(_extract_page_range, [pdf_bytes] * len(starts), starts, stops))
+        except BrokenProcessPool as e:
+            # A worker died (e.g. out of memory); start a fresh pool next time and
+            # extract this document in-process so the meeting still gets its text
+            logging.warning("  ⚠️  PDF worker pool failed, extracting serially: %s", e)
+            _reset_pdf_pool(wait=False)
+            return [_extract_page_range(pdf_bytes, 0, page_count)]
+    
+    def _extract_with_pdfplumber(self, pdf_bytes):
         """Extract text using pdfplumber"""
         try:
             import pdfplumber
-            text = ""
-            with pdfplumber.open(pdf_path) as pdf:
+            parts = []
+            with pdfplumber.open(io.BytesIO(pdf_bytes)) as pdf:
                 for page in pdf.pages:
-                    text += page.extract_text() or ""
-            logging.info(f"  ✓ Extracted {len(text)} characters from PDF")
+                    parts.append(page.extract_text() or "")
+            text = "".join(parts)
+            logging.info("  ✓ Extracted %d characters from PDF", len(text))
             return text
         except Exception as e:
-            logging.error(f"  ✗ pdfplumber extraction error: {e}")
+            logging.error("  ✗ pdfplumber extraction error: %s", e)
             return None
     
     def summarize_agenda(self, agenda_text):
@@ -264,21 +526,14 @@ class AustinCouncilMonitor:
             return self._simple_summary(agenda_text)
         
         try:
-            prompt = f"""Summarize this Austin City Council agenda in 3-5 bullet points. 
-Focus on the most important items, public hearings, and policy decisions.
-Keep it concise and accessible to the general public.
-
-Agenda text:
-{agenda_text[:100000]}"""  # Gemini can handle large context
-            
-            response = self.gemini_model.generate_content(prompt)
+            response = self.gemini_model.generate_content(agenda_text[:MAX_AGENDA_CHARS])
             summary = response.text.strip()
             
-            logging.info(f"  ✓ Generated Gemini summary ({len(summary)} chars)")
+            logging.info("  ✓ Generated Gemini summary (%d chars)", len(summary))
             return summary
             
         except Exception as e:
-            logging.error(f"  ✗ Gemini summarization error: {e}")
+            logging.error("  ✗ Gemini summarization error: %s", e)
             return self._simple_summary(agenda_text)
     
     def _simple_summary(self, text):
@@ -294,13 +549,14 @@ Agenda text:
         
         return summary
     
-    def process_new_meeting(self, meeting_data):
+    def process_new_meeting(self, meeting_data, save=True):
         """
         Complete workflow: download agenda, extract text, summarize, save to DB
+        Pass save=False to leave saving to the caller (e.g. a batched insert)
         """
-        logging.info(f"\n{'='*60}")
-        logging.info(f"📅 Processing: {meeting_data['date']} - {meeting_data['meeting_type']}")
-        logging.info(f"{'='*60}")
+        logging.info("\n" + "="*60)
+        logging.info("📅 Processing: %s - %s", meeting_data['date'], meeting_data['meeting_type'])
+        logging.info("="*60)
         
         # Get agenda URL
         agenda_url = self.get_agenda_url(meeting_data['url'])
@@ -309,59 +565,73 @@ Agenda text:
             logging.warning("  ⚠️  No agenda found for this meeting")
             summary = "Agenda not yet available. Check back later."
         else:
-            logging.info(f"  ✓ Found agenda: {agenda_url}")
+            logging.info("  ✓ Found agenda: %s", agenda_url)
             
             # Download agenda
-            pdf_path = f"temp_agenda_{meeting_data['id']}.pdf"
+            pdf_bytes = self.download_pdf(agenda_url)
             
-            if self.download_pdf(agenda_url, pdf_path):
+            if pdf_bytes:
                 # Extract text
-                agenda_text = self.extract_text_from_pdf(pdf_path)
+                agenda_text = self.extract_text_from_pdf(pdf_bytes)
                 
                 if agenda_text:
                     # Generate summary with Gemini
                     summary = self.summarize_agenda(agenda_text)
                 else:
                     summary = "Unable to extract text from agenda PDF"
-                
-                # Clean up temp file
-                try:
-                    os.remove(pdf_path)
-                except:
-                    pass
             else:
                 summary = "Failed to download agenda PDF"
         
-        # Save to database
-        self.save_meeting(meeting_data, agenda_url, summary)
-        
-        return {
+        meeting_info = {
             **meeting_data,
             'agenda_url': agenda_url,
             'summary': summary
         }
+        
+        # Save to database
+        if save:
+            self.save_meetings([meeting_info])
+        
+        return meeting_info
     
     def save_meeting(self, meeting_data, agenda_url, summary):
         """Save meeting to database"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        self.save_meetings([{**meeting_data, 'agenda_url': agenda_url, 'summary': summary}])
+    
+    def save_meetings(self, meetings):
+        """Save processed meetings to database in a single transaction"""
+        discovered_at = datetime.now().isoformat()
+        rows = [
+            (
+                meeting['id'],
+                meeting['date'],
+                meeting['meeting_type'],
+                meeting['url'],
+                meeting['agenda_url'],
+                meeting['summary'],
+                discovered_at
+            )
+            for meeting in meetings
+        ]
         
-        cursor.execute('''
-            INSERT INTO meetings (id, date, meeting_type, url, agenda_url, summary, discovered_at)
-            VALUES (?, ?, ?, ?, ?, ?, ?)
-        ''', (
-            meeting_data['id'],
-            meeting_data['date'],
-            meeting_data['meeting_type'],
-            meeting_data['url'],
-            agenda_url,
-            summary,
-            datetime.now().isoformat()
-        ))
+        with self.db_lock, self.conn:
+            self.conn.executemany('''
+                INSERT OR IGNORE INTO meetings (id, date, meeting_type, url, agenda_url, summary, discovered_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+            ''', rows)
+        logging.info("  ✓ Saved %d meeting(s) to database", len(rows))
+    
+    def mark_notified(self, meeting_ids):
+        """Record the notification time for the given meetings"""
+        if not meeting_ids:
+            return
         
-        conn.commit()
-        conn.close()
-        logging.info(f"  ✓ Saved to database")
+        placeholders = ','.join('?' * len(meeting_ids))
+        with self.db_lock, self.conn:
+            self.conn.execute(
+                f'UPDATE meetings SET notified_at = ? WHERE id IN ({placeholders})',
+                [datetime.now().isoformat(), *meeting_ids]
+            )
     
     def send_discord_notification(self, meeting_info, webhook_url):
         """Send notification via Discord webhook"""
@@ -381,14 +651,14 @@ Agenda text:
                 }]
             }
             
-            response = requests.post(webhook_url, json=message)
+            response = self.session.post(webhook_url, json=message, timeout=15)
             response.raise_for_status()
             
             logging.info("  ✓ Discord notification sent")
             return True
             
         except Exception as e:
-            logging.error(f"  ✗ Discord notification error: {e}")
+            logging.error("  ✗ Discord notification error: %s", e)
             return False
     
     def run_check_cycle(self, discord_webhook_url=None):
@@ -405,38 +675,52 @@ Agenda text:
             logging.info("\n✓ Check cycle complete. No new meetings found.")
             return []
         
+        # Be respectful: each start takes the slot, which is freed REQUEST_INTERVAL later
+        rate_limiter = threading.Semaphore(1)
+        
+        def process_throttled(meeting_data):
+            rate_limiter.acquire()
+            release = threading.Timer(REQUEST_INTERVAL, rate_limiter.release)
+            release.daemon = True
+            release.start()
+            return self.process_new_meeting(meeting_data, save=False)
+        
         processed = []
-        for meeting_data in new_meetings:
-            meeting_info = self.process_new_meeting(meeting_data)
-            processed.append(meeting_info)
-            
-            # Send Discord notification if configured
-            if discord_webhook_url:
+        first_error = None
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+            futures = {executor.submit(process_throttled, m): m for m in new_meetings}
+            for future in as_completed(futures):
+                try:
+                    processed.append(future.result())
+                except Exception as e:
+                    # Keep the meetings that did finish; the error is re-raised below
+                    logging.error("✗ Error processing meeting %s: %s", futures[future]['id'], e)
+                    first_error = first_error or e
+        
+        # Save all new meetings in one transaction
+        self.save_meetings(processed)
+        
+        # Send Discord notifications if configured
+        if discord_webhook_url:
+            for meeting_info in processed:
                 self.send_discord_notification(meeting_info, discord_webhook_url)
-                
-                # Mark as notified
-                conn = sqlite3.connect(self.db_path)
-                cursor = conn.cursor()
-                cursor.execute(
-                    'UPDATE meetings SET notified_at = ? WHERE id = ?',
-                    (datetime.now().isoformat(), meeting_data['id'])
-                )
-                conn.commit()
-                conn.close()
             
-            time.sleep(2)  # Be respectful between requests
+            # Mark as notified
+            self.mark_notified([meeting_info['id'] for meeting_info in processed])
         
-        logging.info(f"\n{'='*60}")
-        logging.info(f"✅ CHECK CYCLE COMPLETE")
-        logging.info(f"{'='*60}")
-        logging.info(f"New meetings processed: {len(processed)}")
+        if first_error:
+            raise first_error
+        
+        logging.info("\n" + "="*60)
+        logging.info("✅ CHECK CYCLE COMPLETE")
+        logging.info("="*60)
+        logging.info("New meetings processed: %d", len(processed))
         
         return processed
     
     def get_recent_meetings(self, limit=10):
         """Retrieve recent meetings from database"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        cursor = self.conn.cursor()
         
         cursor.execute('''
             SELECT id, date, meeting_type, url, agenda_url, summary, discovered_at
@@ -457,8 +741,12 @@ Agenda text:
                 'discovered_at': row[6]
             })
         
-        conn.close()
         return meetings
+    
+    def close(self):
+        """Close the database connection and stop PDF extraction workers"""
+        self.conn.close()
+        _shutdown_pdf_pool()
 
 
 if __name__ == "__main__":
@@ -484,28 +772,32 @@ if __name__ == "__main__":
         gemini_api_key='GEMINI_API_KEY'
     )
     
-    # Run a check cycle
-    new_meetings = monitor.run_check_cycle(discord_webhook_url=DISCORD_WEBHOOK)
-    
-    # Display results
-    if new_meetings:
+    try:
+        # Run a check cycle
+        new_meetings = monitor.run_check_cycle(discord_webhook_url=DISCORD_WEBHOOK)
+        
+        # Display results
+        if new_meetings:
+            print("\n" + "="*60)
+            print("📋 NEW MEETINGS DISCOVERED")
+            print("="*60)
+            
+            for meeting in new_meetings:
+                print(f"\n📅 {meeting['date']} - {meeting['meeting_type']}")
+                print(f"🔗 {meeting['url']}")
+                print(f"\n{meeting['summary']}")
+                print("-" * 60)
+        
+        # Show recent meetings from database
         print("\n" + "="*60)
-        print("📋 NEW MEETINGS DISCOVERED")
+        print("📚 RECENT MEETINGS IN DATABASE")
         print("="*60)
         
-        for meeting in new_meetings:
+        recent = monitor.get_recent_meetings(limit=5)
+        for meeting in recent:
             print(f"\n📅 {meeting['date']} - {meeting['meeting_type']}")
             print(f"🔗 {meeting['url']}")
-            print(f"\n{meeting['summary']}")
-            print("-" * 60)
-    
-    # Show recent meetings from database
-    print("\n" + "="*60)
-    print("📚 RECENT MEETINGS IN DATABASE")
-    print("="*60)
-    
-    recent = monitor.get_recent_meetings(limit=5)
-    for meeting in recent:
-        print(f"\n📅 {meeting['date']} - {meeting['meeting_type']}")
-        print(f"🔗 {meeting['url']}")
-        print(f"📝 {meeting['summary'][:200]}...")
+            print(f"📝 {meeting['summary'][:200]}...")
+    finally:
+        # Closing checkpoints the WAL back into the database file
+        monitor.close()
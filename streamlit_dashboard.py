@@ -1,5 +1,6 @@
 import streamlit as st
 import sqlite3
+import re
 import pandas as pd
 from datetime import datetime
 import os
@@ -49,89 +50,115 @@ st.markdown("""
 """, unsafe_allow_html=True)
 
 
+# Cache query results across reruns; "Refresh Data" clears the cache
+CACHE_TTL = 300  # seconds
+
+
+def _search_words(search_term):
+    """Split a search into the letter/digit runs the FTS5 tokenizer indexes"""
+    return re.findall(r'[^\W_]+', search_term)
+
+
+def _fts_query(words):
+    """Turn search words into an FTS5 query: every word must match as a prefix"""
+    return ' '.join('"' + word + '"*' for word in words)
+
+
+@st.cache_data(ttl=CACHE_TTL)
+def _fetch_meetings(db_path, limit, search_term):
+    """Query meetings from database with optional filtering"""
+    conn = sqlite3.connect(db_path)
+    
+    query = '''
+        SELECT m.id, m.date, m.meeting_type, m.url, m.agenda_url, m.summary, m.discovered_at
+        FROM meetings m
+    '''
+    params = []
+    
+    if search_term:
+        has_fts = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'meetings_fts'"
+        ).fetchone()
+        
+        words = _search_words(search_term)
+        
+        if has_fts and words:
+            query += ' JOIN meetings_fts f ON f.id = m.id WHERE meetings_fts MATCH ?'
+            params.append(_fts_query(words))
+        else:
+            # No search index yet, or nothing FTS5 can match (e.g. just "&")
+            query += ' WHERE (m.meeting_type LIKE ? OR m.summary LIKE ?)'
+            params.extend([f'%{search_term}%', f'%{search_term}%'])
+    
+    query += ' ORDER BY m.date DESC'
+    
+    if limit:
+        query += ' LIMIT ?'
+        params.append(limit)
+    
+    meetings = pd.read_sql_query(query, conn, params=params)
+    
+    # Missing values come back as NaN, which is truthy; restore None like the raw rows
+    meetings = meetings.astype(object).where(meetings.notna(), None)
+    
+    conn.close()
+    return meetings
+
+
+@st.cache_data(ttl=CACHE_TTL)
+def _fetch_stats(db_path):
+    """Query database statistics"""
+    conn = sqlite3.connect(db_path)
+    cursor = conn.cursor()
+    
+    # Total meetings
+    cursor.execute('SELECT COUNT(*) FROM meetings')
+    total_meetings = cursor.fetchone()[0]
+    
+    # Meetings with agendas
+    cursor.execute('SELECT COUNT(*) FROM meetings WHERE agenda_url IS NOT NULL')
+    with_agendas = cursor.fetchone()[0]
+    
+    # Most recent meeting date
+    cursor.execute('SELECT MAX(date) FROM meetings')
+    latest_date = cursor.fetchone()[0]
+    
+    # Meeting types breakdown
+    cursor.execute('SELECT meeting_type, COUNT(*) FROM meetings GROUP BY meeting_type')
+    meeting_types = dict(cursor.fetchall())
+    
+    conn.close()
+    
+    return {
+        'total_meetings': total_meetings,
+        'with_agendas': with_agendas,
+        'latest_date': latest_date,
+        'meeting_types': meeting_types
+    }
+
+
 class MeetingDashboard:
     def __init__(self, db_path='austin_meetings.db'):
         self.db_path = db_path
         
-    def get_connection(self):
-        """Create database connection"""
+    def database_exists(self):
+        """Check that the database file exists"""
         if not os.path.exists(self.db_path):
             st.error(f"Database not found: {self.db_path}")
-            return None
-        return sqlite3.connect(self.db_path)
+            return False
+        return True
     
     def get_meetings(self, limit=None, search_term=None):
         """Retrieve meetings from database with optional filtering"""
-        conn = self.get_connection()
-        if not conn:
-            return []
-        
-        query = '''
-            SELECT id, date, meeting_type, url, agenda_url, summary, discovered_at
-            FROM meetings
-            WHERE 1=1
-        '''
-        params = []
-        
-        if search_term:
-            query += ' AND (meeting_type LIKE ? OR summary LIKE ?)'
-            params.extend([f'%{search_term}%', f'%{search_term}%'])
-        
-        query += ' ORDER BY date DESC'
-        
-        if limit:
-            query += f' LIMIT {limit}'
-        
-        cursor = conn.cursor()
-        cursor.execute(query, params)
-        
-        meetings = []
-        for row in cursor.fetchall():
-            meetings.append({
-                'id': row[0],
-                'date': row[1],
-                'meeting_type': row[2],
-                'url': row[3],
-                'agenda_url': row[4],
-                'summary': row[5],
-                'discovered_at': row[6]
-            })
-        
-        conn.close()
-        return meetings
+        if not self.database_exists():
+            return pd.DataFrame()
+        return _fetch_meetings(self.db_path, limit, search_term)
     
     def get_stats(self):
         """Get database statistics"""
-        conn = self.get_connection()
-        if not conn:
+        if not self.database_exists():
             return {}
-        
-        cursor = conn.cursor()
-        
-        # Total meetings
-        cursor.execute('SELECT COUNT(*) FROM meetings')
-        total_meetings = cursor.fetchone()[0]
-        
-        # Meetings with agendas
-        cursor.execute('SELECT COUNT(*) FROM meetings WHERE agenda_url IS NOT NULL')
-        with_agendas = cursor.fetchone()[0]
-        
-        # Most recent meeting date
-        cursor.execute('SELECT MAX(date) FROM meetings')
-        latest_date = cursor.fetchone()[0]
-        
-        # Meeting types breakdown
-        cursor.execute('SELECT meeting_type, COUNT(*) FROM meetings GROUP BY meeting_type')
-        meeting_types = dict(cursor.fetchall())
-        
-        conn.close()
-        
-        return {
-            'total_meetings': total_meetings,
-            'with_agendas': with_agendas,
-            'latest_date': latest_date,
-            'meeting_types': meeting_types
-        }
+        return _fetch_stats(self.db_path)
 
 
 def main():
@@ -154,6 +181,7 @@ def main():
         
         # Refresh button
         if st.button("🔄 Refresh Data"):
+            st.cache_data.clear()
             st.rerun()
         
         st.markdown("---")
@@ -203,7 +231,9 @@ def main():
     # Get meetings
     meetings = dashboard.get_meetings(limit=show_limit, search_term=search_term if search_term else None)
     
-    if not meetings:
+    if meetings.empty and search_term:
+        st.warning(f"No meetings found matching '{search_term}'")
+    elif meetings.empty:
         st.warning("No meetings found. Make sure the monitoring script has run at least once.")
         st.info("Run `python3 austin_meeting_monitor_gemini.py` to populate the database.")
     else:
@@ -212,41 +242,41 @@ def main():
         
         if view_mode == "Card View":
             # Card view - more visual
-            for meeting in meetings:
+            for meeting in meetings.itertuples():
                 with st.container():
                     st.markdown(f"""
                     <div class="meeting-card">
-                        <div class="meeting-date">📅 {meeting['date']}</div>
-                        <div class="meeting-type">{meeting['meeting_type']}</div>
+                        <div class="meeting-date">📅 {meeting.date}</div>
+                        <div class="meeting-type">{meeting.meeting_type}</div>
                     </div>
                     """, unsafe_allow_html=True)
                     
                     col1, col2, col3 = st.columns([2, 2, 1])
                     
                     with col1:
-                        st.markdown(f"[🔗 Meeting Page]({meeting['url']})")
+                        st.markdown(f"[🔗 Meeting Page]({meeting.url})")
                     
                     with col2:
-                        if meeting['agenda_url']:
-                            st.markdown(f"[📄 View Agenda PDF]({meeting['agenda_url']})")
+                        if meeting.agenda_url:
+                            st.markdown(f"[📄 View Agenda PDF]({meeting.agenda_url})")
                         else:
                             st.text("Agenda not yet available")
                     
                     with col3:
                         with st.expander("ℹ️ Details"):
-                            st.text(f"ID: {meeting['id']}")
-                            st.text(f"Added: {meeting['discovered_at'][:10]}")
+                            st.text(f"ID: {meeting.id}")
+                            st.text(f"Added: {meeting.discovered_at[:10]}")
                     
                     # Summary
                     st.markdown("**Summary:**")
-                    st.markdown(f'<div class="summary-text">{meeting["summary"]}</div>', unsafe_allow_html=True)
+                    st.markdown(f'<div class="summary-text">{meeting.summary}</div>', unsafe_allow_html=True)
                     
                     st.markdown("---")
         
         else:
             # Table view - more compact
-            df = pd.DataFrame(meetings)
-            df['date'] = pd.to_datetime(df['date'])
+            df = meetings.copy()
+            df['date'] = pd.to_datetime(df['date'], format='%Y-%m-%d', errors='coerce')
             
             # Create clickable links
             df['Meeting Link'] = df['url'].apply(lambda x: f'[Link]({x})')
@@ -261,12 +291,12 @@ def main():
             
             # Show summaries below
             st.subheader("📝 Meeting Summaries")
-            for meeting in meetings:
-                with st.expander(f"{meeting['date']} - {meeting['meeting_type']}"):
-                    st.markdown(meeting['summary'])
-                    st.markdown(f"[View Meeting Page]({meeting['url']})")
-                    if meeting['agenda_url']:
-                        st.markdown(f"[Download Agenda PDF]({meeting['agenda_url']})")
+            for meeting in meetings.itertuples():
+                with st.expander(f"{meeting.date} - {meeting.meeting_type}"):
+                    st.markdown(meeting.summary)
+                    st.markdown(f"[View Meeting Page]({meeting.url})")
+                    if meeting.agenda_url:
+                        st.markdown(f"[Download Agenda PDF]({meeting.agenda_url})")
     
     # Footer
     st.markdown("---")